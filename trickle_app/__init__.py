@@ -4,15 +4,27 @@ Trickle App - A Python package for high-performance video streaming over trickle
 Provides functionality to subscribe to and publish video streams with real-time processing.
 """
 
-from .client import TrickleClient, SimpleTrickleClient
-from .server import TrickleApp, create_app
-from .protocol import TrickleProtocol
-from .frames import VideoFrame, AudioFrame, VideoOutput, AudioOutput
-from .publisher import TricklePublisher
-from .subscriber import TrickleSubscriber
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "0.1.0"
 
+# Public names are resolved lazily on first access so that importing the
+# package does not pull in torch, av, numpy and aiohttp up front.
+_LAZY = {
+    "TrickleClient": ("client", "TrickleClient"),
+    "SimpleTrickleClient": ("client", "SimpleTrickleClient"),
+    "TrickleApp": ("server", "TrickleApp"),
+    "create_app": ("server", "create_app"),
+    "TrickleProtocol": ("protocol", "TrickleProtocol"),
+    "VideoFrame": ("frames", "VideoFrame"),
+    "AudioFrame": ("frames", "AudioFrame"),
+    "VideoOutput": ("frames", "VideoOutput"),
+    "AudioOutput": ("frames", "AudioOutput"),
+    "TricklePublisher": ("publisher", "TricklePublisher"),
+    "TrickleSubscriber": ("subscriber", "TrickleSubscriber"),
+}
+
 __all__ = [
     "TrickleClient",
     "SimpleTrickleClient",
@@ -20,9 +32,32 @@ __all__ = [
     "create_app",
     "TrickleProtocol",
     "VideoFrame",
-    "AudioFrame", 
+    "AudioFrame",
     "VideoOutput",
     "AudioOutput",
     "TricklePublisher",
     "TrickleSubscriber",
-] 
\ No newline at end of file
+]
+
+if TYPE_CHECKING:
+    from .client import TrickleClient, SimpleTrickleClient
+    from .server import TrickleApp, create_app
+    from .protocol import TrickleProtocol
+    from .frames import VideoFrame, AudioFrame, VideoOutput, AudioOutput
+    from .publisher import TricklePublisher
+    from .subscriber import TrickleSubscriber
+
+
+def __getattr__(name: str):
+    """Import and cache a public name on first access (PEP 562)."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
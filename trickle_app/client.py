@@ -11,7 +11,7 @@ import queue
 from typing import Optional, Callable, AsyncGenerator, Dict, Any
 
 from .protocol import TrickleProtocol
-from .frames import VideoFrame, VideoOutput, InputFrame, OutputFrame
+from .frames import VideoFrame, VideoOutput, OutputFrame
 
 logger = logging.getLogger(__name__)
 
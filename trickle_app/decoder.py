@@ -14,7 +14,7 @@ from typing import cast, Callable
 import numpy as np
 import torch
 
-from .frames import InputFrame, VideoFrame, AudioFrame
+from .frames import VideoFrame, AudioFrame
 
 logger = logging.getLogger(__name__)
 
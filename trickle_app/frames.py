@@ -5,11 +5,10 @@ Defines VideoFrame, AudioFrame, and their output counterparts for handling
 media data in the trickle streaming pipeline.
 """
 
-import time
 import torch
 import numpy as np
 import av
-from typing import Optional, Dict, Any, Union, List
+from typing import Optional, Dict, Union, List
 from fractions import Fraction
 from abc import ABC
 
@@ -17,6 +16,9 @@ from abc import ABC
 DEFAULT_WIDTH = 704
 DEFAULT_HEIGHT = 384
 
+# Time base for frames built directly from tensors (timestamps in whole units)
+TENSOR_TIME_BASE = Fraction(1, 1)
+
 class SideData:
     """Base class for side data, needed to keep it consistent with av frame side_data"""
     skipped: bool = True
@@ -58,7 +60,7 @@ class VideoFrame(InputFrame):
     @classmethod
     def from_tensor(cls, tensor: torch.Tensor, timestamp: int = 0) -> 'VideoFrame':
         """Create VideoFrame from tensor with timestamp."""
-        return cls(tensor, timestamp, Fraction(1, 1))
+        return cls(tensor, timestamp, TENSOR_TIME_BASE)
     
     def replace_tensor(self, new_tensor: torch.Tensor) -> 'VideoFrame':
         """Create a new VideoFrame with a different tensor."""
@@ -10,13 +10,12 @@ import time
 import asyncio
 import logging
 import threading
-from typing import Callable, Optional, Dict, Any
+from typing import Callable, Optional
 
 from .subscriber import TrickleSubscriber  
 from .publisher import TricklePublisher
 from .decoder import decode_av
 from .encoder import encode_av
-from .frames import InputFrame, OutputFrame
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +10,7 @@ import logging
 import queue
 import json
 import threading
-from typing import AsyncGenerator, Optional, Callable
+from typing import AsyncGenerator, Optional
 
 from .frames import InputFrame, OutputFrame, AudioFrame, AudioOutput, DEFAULT_WIDTH, DEFAULT_HEIGHT
 from .media import run_subscribe, run_publish
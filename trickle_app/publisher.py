@@ -8,7 +8,6 @@ with automatic reconnection and error handling.
 import asyncio
 import aiohttp
 import logging
-from contextlib import asynccontextmanager
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -7,10 +7,8 @@ starting streams, updating parameters, and monitoring status.
 
 import asyncio
 import logging
-import json
 import time
 from typing import Optional, Dict, Any, Callable
-from dataclasses import dataclass
 
 from aiohttp import web
 from pydantic import BaseModel, Field